@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from entity import Actor, Entity, Item
 
 class Action:
+    __slots__ = ("entity",)
+
     def __init__(self, entity: Actor) -> None:
         super().__init__()
         self.entity = entity
@@ -30,6 +32,8 @@ class Action:
         raise NotImplementedError()
 
 class ItemAction(Action):
+    __slots__ = ("item", "target_xy")
+
     def __init__(
         self, entity: Actor, item: Item, target_xy: Optional[Tuple[int, int]] = None
     ):
@@ -51,34 +55,45 @@ class ItemAction(Action):
 class PickupAction(Action):
     """Pickup an item and add it to the inventory, if there is room for it."""
 
+    __slots__ = ()
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
 
     def perform(self) -> None:
-        actor_location_x = self.entity.x
-        actor_location_y = self.entity.y
-        inventory = self.entity.inventory
+        entity = self.entity
+        engine = entity.gamemap.engine
+        game_map = engine.game_map
+        inventory = entity.inventory
 
-        for item in self.engine.game_map.items:
-            if actor_location_x == item.x and actor_location_y == item.y:
-                if len(inventory.items) >= inventory.capacity:
-                    raise exceptions.Impossible("Your inventory is full.")
+        for item in game_map.get_items_at_location(entity.x, entity.y):
+            if len(inventory.items) >= inventory.capacity:
+                raise exceptions.Impossible("Your inventory is full.")
 
-                self.engine.game_map.entities.remove(item)
-                item.parent = self.entity.inventory
-                inventory.items.append(item)
+            game_map.remove_entity(item)
+            item.parent = inventory
+            inventory.items.append(item)
 
-                self.engine.message_log.add_message(f"You picked up the {item.name}!")
-                return
+            engine.message_log.add_message(f"You picked up the {item.name}!")
+            return
 
         raise exceptions.Impossible("There is nothing here to pick up.")
 
 class ActionWithDirection(Action):
+    __slots__ = ("dx", "dy")
+
     def __init__(self, entity: Actor, dx: int, dy: int):
         super().__init__(entity)
 
         self.dx = dx
         self.dy = dy
+
+    def redirect(self, dx: int, dy: int) -> ActionWithDirection:
+        """Point this action in a new direction and return it, so it can be reused."""
+        self.dx = dx
+        self.dy = dy
+        return self
+
     @property
     def dest_xy(self) -> Tuple[int, int]:
         """Returns this actions destination."""
@@ -97,53 +112,68 @@ class ActionWithDirection(Action):
         raise NotImplementedError()
 
 class BumpAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
         if self.target_actor:
-            return MeleeAction(self.entity, self.dx, self.dy).perform()
+            return self.entity._melee.redirect(self.dx, self.dy).perform()
 
         else:
-            return MovementAction(self.entity, self.dx, self.dy).perform()
+            return self.entity._movement.redirect(self.dx, self.dy).perform()
 
 class MeleeAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
-        target = self.target_actor
+        entity = self.entity
+        engine = entity.gamemap.engine
+        target = engine.game_map.get_actor_at_location(
+            entity.x + self.dx, entity.y + self.dy
+        )
         if not target:
             raise exceptions.Impossible("Nothing to attack.")
 
-        damage = self.entity.fighter.power - target.fighter.defense
+        damage = entity.fighter.power - target.fighter.defense
 
-        attack_desc = f"{self.entity.name.capitalize()} attacks {target.name}"
-        if self.entity is self.engine.player:
+        attack_desc = f"{entity.name.capitalize()} attacks {target.name}"
+        if entity is engine.player:
             attack_color = color.player_atk
         else:
             attack_color = color.enemy_atk
 
         if damage > 0:
-            self.engine.message_log.add_message(
+            engine.message_log.add_message(
                 f"{attack_desc} for {damage} hit points.", attack_color
             )
             target.fighter.hp -= damage
         else:
-            self.engine.message_log.add_message(
+            engine.message_log.add_message(
                 f"{attack_desc} but does no damage.", attack_color
             )
 
 
 class MovementAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
-        speed = 2 if getattr(self.entity, "is_speeded", False) else 1
+        entity = self.entity
+        engine = entity.gamemap.engine
+        game_map = engine.game_map
+        in_bounds = game_map.in_bounds
+        walkable = game_map.walkable
+        get_blocking_entity = game_map.get_blocking_entity_at_location
+
+        speed = 2 if entity.is_speeded else 1
 
         max_valid_step = 0
         for step in range(1, speed + 1):
-            dx = self.dx * step
-            dy = self.dy * step
-            dest_x = self.entity.x + dx
-            dest_y = self.entity.y + dy
+            dest_x = entity.x + self.dx * step
+            dest_y = entity.y + self.dy * step
 
             blocked = (
-                not self.engine.game_map.in_bounds(dest_x, dest_y)
-                or not self.engine.game_map.tiles["walkable"][dest_x, dest_y]
-                or self.engine.game_map.get_blocking_entity_at_location(dest_x, dest_y)
+                not in_bounds(dest_x, dest_y)
+                or not walkable[dest_x, dest_y]
+                or get_blocking_entity(dest_x, dest_y)
             )
 
             if blocked:
@@ -153,35 +183,37 @@ class MovementAction(ActionWithDirection):
         if max_valid_step == 0:
             raise exceptions.Impossible("That way is blocked.")
         else:
-            dx = self.dx * max_valid_step
-            dy = self.dy * max_valid_step
-            self.entity.move(dx, dy)
+            entity.move(self.dx * max_valid_step, self.dy * max_valid_step)
 
         # Decrement speed effect if active
-        if getattr(self.entity, "is_speeded", False):
-            self.entity.speed_turns_remaining -= 1
-            if self.entity.speed_turns_remaining <= 0:
-                self.entity.is_speeded = False
-                self.engine.message_log.add_message(
-                    f"{self.entity.name} is no longer under the effect of a speed scroll.",
+        if entity.is_speeded:
+            entity.speed_turns_remaining -= 1
+            if entity.speed_turns_remaining <= 0:
+                entity.is_speeded = False
+                engine.message_log.add_message(
+                    f"{entity.name} is no longer under the effect of a speed scroll.",
                     color.status_effect_removed,
                 )
 class WaitAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         pass
 class DropItem(ItemAction):
+    __slots__ = ()
+
     def perform(self) -> None:
         if self.entity.equipment.item_is_equipped(self.item):
             self.entity.equipment.toggle_equip(self.item)
 
         self.entity.inventory.drop(self.item)
 class TakeStairsAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         """
         Take the stairs, if any exist at the entity's location.
         """
-        print("Player position:", (self.entity.x, self.entity.y))
-        print("Downstairs tiles:", self.engine.game_map.downstairs_tiles)
         if (self.entity.x, self.entity.y) in self.engine.game_map.downstairs_tiles:
             self.engine.game_world.generate_floor()
             self.engine.message_log.add_message(
@@ -190,6 +222,8 @@ class TakeStairsAction(Action):
         else:
             raise exceptions.Impossible("There are no stairs here.")
 class EquipAction(Action):
+    __slots__ = ("item",)
+
     def __init__(self, entity: Actor, item: Item):
         super().__init__(entity)
 
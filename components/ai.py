@@ -7,7 +7,7 @@ import tcod
 import random
 from entity import Item, Actor  # Add this import
 
-from actions import Action, BumpAction, MeleeAction, MovementAction, WaitAction
+from actions import Action, WaitAction
 
 
 class BaseAI(Action):
@@ -20,7 +20,7 @@ class BaseAI(Action):
         If there is no valid path then returns an empty list.
         """
         # Copy the walkable array.
-        cost = np.array(self.entity.gamemap.tiles["walkable"], dtype=np.int8)
+        cost = np.array(self.entity.gamemap.walkable, dtype=np.int8)
 
         for entity in self.entity.gamemap.entities:
             # Check that an enitiy blocks movement and the cost isn't zero (blocking.)
@@ -55,14 +55,14 @@ class HostileEnemy(BaseAI):
 
         if self.engine.game_map.visible[self.entity.x, self.entity.y]:
             if distance <= 1:
-                return MeleeAction(self.entity, dx, dy).perform()
+                return self.entity._melee.redirect(dx, dy).perform()
 
             self.path = self.get_path_to(target.x, target.y)
 
         if self.path:
             dest_x, dest_y = self.path.pop(0)
-            return MovementAction(
-                self.entity, dest_x - self.entity.x, dest_y - self.entity.y,
+            return self.entity._movement.redirect(
+                dest_x - self.entity.x, dest_y - self.entity.y,
             ).perform()
 
         return WaitAction(self.entity).perform()
@@ -106,7 +106,7 @@ class ConfusedEnemy(BaseAI):
 
             # The actor will either try to move or attack in the chosen random direction.
             # Its possible the actor will just bump into the wall, wasting a turn.
-            return BumpAction(self.entity, direction_x, direction_y,).perform()
+            return self.entity._bump.redirect(direction_x, direction_y).perform()
 class HypnotizedEnemy(BaseAI):
     """
     A hypnotized enemy will not attack the player, but will still move around.
@@ -166,7 +166,7 @@ class HypnotizedEnemy(BaseAI):
 
                 # The actor will either try to move or attack in the chosen random direction.
                 # Its possible the actor will just bump into the wall, wasting a turn.
-                return MovementAction(self.entity, direction_x, direction_y,).perform()
+                return self.entity._movement.redirect(direction_x, direction_y).perform()
             # If a target is found, move towards it.
             dx = target.x - self.entity.x
             dy = target.y - self.entity.y
@@ -175,13 +175,13 @@ class HypnotizedEnemy(BaseAI):
 
             if self.engine.game_map.visible[self.entity.x, self.entity.y]:
                 if distance <= 1:
-                    return MeleeAction(self.entity, dx, dy).perform()
+                    return self.entity._melee.redirect(dx, dy).perform()
 
                 self.path = self.get_path_to(target.x, target.y)
             if self.path:
                 dest_x, dest_y = self.path.pop(0)
-                return MovementAction(
-                    self.entity, dest_x - self.entity.x, dest_y - self.entity.y,
+                return self.entity._movement.redirect(
+                    dest_x - self.entity.x, dest_y - self.entity.y,
                 ).perform()
 
             return WaitAction(self.entity).perform()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Tuple, Type, TYPE_CHECKING
+
+import numpy as np  # type: ignore
+import tcod
 
 import actions
 import color
@@ -8,17 +11,19 @@ from components.base_component import BaseComponent
 from exceptions import Impossible
 import components.inventory
 import components.ai
+import perf_kernels
 from input_handlers import (
     ActionOrHandler,
     AreaRangedAttackHandler,
     SingleRangedAttackHandler,
 )
-from render_functions import draw_lightning
 if TYPE_CHECKING:
     from entity import Actor, Item
 
 
 class Consumable(BaseComponent):
+    __slots__ = ()
+
     parent: Item
 
     def get_action(self, consumer: Actor) -> Optional[ActionOrHandler]:
@@ -31,6 +36,19 @@ class Consumable(BaseComponent):
         `action` is the context for this activation.
         """
         raise NotImplementedError()
+
+    def _validate_visible_target(self, action: actions.ItemAction) -> Tuple[int, int]:
+        """Return the actions target as integer map coordinates.
+
+        Raises Impossible if the player cannot see the target tile.
+        """
+        x, y = action.target_xy
+        x = int(x)
+        y = int(y)
+        if not self.engine.game_map.visible[x, y]:
+            raise Impossible("You cannot target an area that you cannot see.")
+        return x, y
+
     def consume(self) -> None:
         """Remove the consumed item from its containing inventory."""
         entity = self.parent
@@ -40,6 +58,8 @@ class Consumable(BaseComponent):
 
 
 class HealingConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
 
@@ -57,6 +77,8 @@ class HealingConsumable(Consumable):
         else:
             raise Impossible(f"Your health is already full.")
 class LightningDamageConsumable(Consumable):
+    __slots__ = ("damage", "maximum_range")
+
     def __init__(self, damage: int, maximum_range: int):
         self.damage = damage
         self.maximum_range = maximum_range
@@ -64,24 +86,29 @@ class LightningDamageConsumable(Consumable):
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
         target = None
-        closest_distance = self.maximum_range + 1.0
-
-        for actor in self.engine.game_map.actors:
-            if actor is not consumer and self.parent.gamemap.visible[actor.x, actor.y]:
-                distance = consumer.distance(actor.x, actor.y)
+        game_map = self.engine.game_map
 
-                if distance < closest_distance:
-                    target = actor
-                    closest_distance = distance
+        # The consumer is the only living actor on its own tile, so the kernel
+        # skipping the zero-distance point skips the consumer.
+        actors, xs, ys = game_map.actor_positions
+        closest = perf_kernels.nearest_visible(
+            xs, ys, game_map.visible, consumer.x, consumer.y, (self.maximum_range + 1) ** 2
+        )
+        if closest >= 0:
+            target = actors[closest]
 
         if target:
             self.engine.message_log.add_message(
                 f"A lighting bolt strikes the {target.name} with a loud thunder, for {self.damage} damage!"
             )
             target.fighter.take_damage(self.damage)
+            start = (action.entity.x, action.entity.y)
+            end = (target.x, target.y)
             self.engine.lightning_effect = {
-                "start": (action.entity.x, action.entity.y),
-                "end": (target.x, target.y),
+                "start": start,
+                "end": end,
+                # Rasterize the bolt once, it is drawn every frame it is shown.
+                "points": tcod.los.bresenham(start, end),
                 "color": (255, 255, 0),
                 "frames": 10,  # Show for 30 frames (~0.5s at 60fps)
             }
@@ -89,6 +116,13 @@ class LightningDamageConsumable(Consumable):
         else:
             raise Impossible("No enemy is close enough to strike.")
 class ConfusionConsumable(Consumable):
+    __slots__ = ("number_of_turns",)
+
+    # The AI given to the target and the messages shown, overridden by subclasses.
+    ai_cls: Type[components.ai.BaseAI] = components.ai.ConfusedEnemy
+    verb = "confuse"
+    message = "The eyes of the {name} look vacant, as it starts to stumble around!"
+
     def __init__(self, number_of_turns: int):
         self.number_of_turns = number_of_turns
 
@@ -103,53 +137,29 @@ class ConfusionConsumable(Consumable):
 
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
+        self._validate_visible_target(action)
         target = action.target_actor
-        x, y = action.target_xy  # Ensure target_xy is set
-        x = int(x)
-        y = int(y)
-        if not self.engine.game_map.visible[x, y]:
-            print(f"Target XY: {x}, {y}")            
-            raise Impossible("You cannot target an area that you cannot see.")
         if target is consumer:
-            print(f"Target XY: {x}, {y}")
-            raise Impossible("You cannot confuse yourself!")
+            raise Impossible(f"You cannot {self.verb} yourself!")
         if not target:
-            print(f"Target XY: {x}, {y}")
             raise Impossible("You must select an enemy to target.")
 
         self.engine.message_log.add_message(
-            f"The eyes of the {target.name} look vacant, as it starts to stumble around!",
-            color.status_effect_applied,
+            self.message.format(name=target.name), color.status_effect_applied,
         )
-        target.ai = components.ai.ConfusedEnemy(
+        target.ai = self.ai_cls(
             entity=target, previous_ai=target.ai, turns_remaining=self.number_of_turns,
         )
         self.consume()
 class HypnotizingConsumable(ConfusionConsumable):
-    def __init__(self, number_of_turns: int):
-        super().__init__(number_of_turns)
-    def activate(self, action: actions.ItemAction) -> None:
-        consumer = action.entity
-        target = action.target_actor
-        x, y = action.target_xy  # Ensure target_xy is set
-        x = int(x)
-        y = int(y)
-        if not self.engine.game_map.visible[x, y]:
-            raise Impossible("You cannot target an area that you cannot see.")
-        if target is consumer:
-            raise Impossible("You cannot hypnotize yourself!")
-        if not target:
-            raise Impossible("You must select an enemy to target.")
+    __slots__ = ()
 
-        self.engine.message_log.add_message(
-            f"The {target.name} looks entranced, as it starts to follow your commands!",
-            color.status_effect_applied,
-        )
-        target.ai = components.ai.HypnotizedEnemy(
-            entity=target, previous_ai=target.ai, turns_remaining=self.number_of_turns,
-        )
-        self.consume()
+    ai_cls = components.ai.HypnotizedEnemy
+    verb = "hypnotize"
+    message = "The {name} looks entranced, as it starts to follow your commands!"
 class FireballDamageConsumable(Consumable):
+    __slots__ = ("damage", "radius")
+
     def __init__(self, damage: int, radius: int):
         self.damage = damage
         self.radius = radius
@@ -166,31 +176,30 @@ class FireballDamageConsumable(Consumable):
         return None
 
     def activate(self, action: actions.ItemAction) -> None:
-        x, y = action.target_xy
-        target_xy = (int(x), int(y))
-        if not self.engine.game_map.visible[target_xy]:
-            raise Impossible("You cannot target an area that you cannot see.")
+        target_xy = self._validate_visible_target(action)
 
-        affected_tiles = []
         targets_hit = False
-        for actor in self.engine.game_map.actors:
-            if actor.distance(*target_xy) <= self.radius:
-                self.engine.message_log.add_message(
-                    f"The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!"
-                )
-                actor.fighter.take_damage(self.damage)
-                targets_hit = True
-        # Collect all tiles affected by fireball
-        for tx in range(target_xy[0] - self.radius, target_xy[0] + self.radius + 1):
-            for ty in range(target_xy[1] - self.radius, target_xy[1] + self.radius + 1):
-                if (
-                    self.engine.game_map.in_bounds(tx, ty)
-                    and (abs(tx - target_xy[0]) ** 2 + abs(ty - target_xy[1]) ** 2) <= self.radius ** 2
-                ):
-                    affected_tiles.append((tx, ty))
-        if affected_tiles:
+        add_message = self.engine.message_log.add_message
+        for actor in self.engine.game_map.get_actors_in_radius(*target_xy, self.radius):
+            add_message(
+                f"The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!"
+            )
+            actor.fighter.take_damage(self.damage)
+            targets_hit = True
+        # Collect all tiles affected by fireball: the disk around the target,
+        # clipped to the map, as parallel arrays of x and y coordinates.
+        r = self.radius
+        game_map = self.engine.game_map
+        xs, ys = np.nonzero(perf_kernels.disk_mask(r))
+        xs += target_xy[0] - r
+        ys += target_xy[1] - r
+        in_bounds = (0 <= xs) & (xs < game_map.width) & (0 <= ys) & (ys < game_map.height)
+        xs = xs[in_bounds]
+        ys = ys[in_bounds]
+        if xs.size:
             self.engine.fireball_effect = {
-                "tiles": affected_tiles,
+                "xs": xs,
+                "ys": ys,
                 "frames": 10,
                 "color": (255, 0, 0),  # Red
             }
@@ -198,6 +207,8 @@ class FireballDamageConsumable(Consumable):
             raise Impossible("There are no targets in the radius.")
         self.consume()
 class SpeedScroll(Consumable):
+    __slots__ = ("number_of_turns",)
+
     def __init__(self, number_of_turns: int):
         self.number_of_turns = number_of_turns
 
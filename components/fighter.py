@@ -62,6 +62,7 @@ class Fighter(BaseComponent):
         self.parent.ai = None
         self.parent.name = f"remains of {self.parent.name}"
         self.parent.render_order = RenderOrder.CORPSE
+        self.gamemap.actor_died(self.parent)
 
         self.engine.message_log.add_message(
             death_message, death_message_color
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-import render_functions
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from message_log import MessageLog
 import exceptions
-import lzma
 import pickle
+import struct
+
+import zstandard as zstd
 
 from tcod.context import Context
 from tcod.console import Console
 from tcod.map import compute_fov
 
+from render_functions import (
+    draw_lightning,
+    render_bar,
+    render_dungeon_level,
+    render_names_at_mouse_location,
+)
+
 if TYPE_CHECKING:
     from entity import Actor
     from game_map import GameMap, GameWorld
@@ -26,19 +34,38 @@ class Engine:
         self.mouse_location = (0, 0)
         self.lightning_effect = None # For lightning effect rendering
         self.fireball_effect = None  # For fireball effect rendering
+        # (x, y, floor) the current FOV was computed from, see update_fov.
+        self._fov_cache_key: Optional[Tuple[int, int, int]] = None
     def handle_enemy_turns(self) -> None:
-        for entity in set(self.game_map.actors) - {self.player}:
-            if entity.ai:
-                try:
-                    entity.ai.perform()
-                except exceptions.Impossible:
-                    pass  # Ignore impossible action exceptions from AI.
+        player = self.player
+        # Iterate over a snapshot, enemies killed this turn leave the list.
+        for entity in tuple(self.game_map.actors):
+            if entity is player or not entity.ai:
+                continue
+            try:
+                entity.ai.perform()
+            except exceptions.Impossible:
+                pass  # Ignore impossible action exceptions from AI.
     
 
+    def invalidate_fov(self) -> None:
+        """Force the next update_fov call to recompute the field of view."""
+        self._fov_cache_key = None
+
     def update_fov(self) -> None:
-        """Recompute the visible area based on the players point of view."""
+        """Recompute the visible area based on the players point of view.
+
+        Nothing changes the map's transparency within a floor, so when the
+        player hasn't moved since the last call, `visible` already holds the
+        right result and `explored` already includes it.
+        """
+        cache_key = (self.player.x, self.player.y, self.game_world.current_floor)
+        if cache_key == self._fov_cache_key:
+            return
+        self._fov_cache_key = cache_key
+
         self.game_map.visible[:] = compute_fov(
-            self.game_map.tiles["transparent"],
+            self.game_map.transparent,
             (self.player.x, self.player.y),
             radius=4,
         )
@@ -48,19 +75,19 @@ class Engine:
     def render(self, console: Console) -> None:
         self.game_map.render(console)
         self.message_log.render(console=console, x=21, y=45, width=40, height=5)        
-        render_functions.render_bar(
+        render_bar(
             console=console,
             current_value=self.player.fighter.hp,
             maximum_value=self.player.fighter.max_hp,
             total_width=20,
         )
-        render_functions.render_dungeon_level(
+        render_dungeon_level(
             console=console,
             dungeon_level=self.game_world.current_floor,
             location=(0, 47),
         )
 
-        render_functions.render_names_at_mouse_location(
+        render_names_at_mouse_location(
             console=console, x=21, y=44, engine=self
         )
 
@@ -76,26 +103,42 @@ class Engine:
         )
 
         if self.lightning_effect:
-            render_functions.draw_lightning(
+            draw_lightning(
                 console,
-                self.lightning_effect["start"],
-                self.lightning_effect["end"],
+                self.lightning_effect["points"],
                 self.lightning_effect["color"],
             )
             self.lightning_effect["frames"] -= 1
             if self.lightning_effect["frames"] <= 0:
                 self.lightning_effect = None
         if self.fireball_effect:
-            for x, y in self.fireball_effect["tiles"]:
-                console.bg[x, y] = self.fireball_effect["color"]
+            console.bg[
+                self.fireball_effect["xs"], self.fireball_effect["ys"]
+            ] = self.fireball_effect["color"]
             self.fireball_effect["frames"] -= 1
             if self.fireball_effect["frames"] <= 0:
                 self.fireball_effect = None
 
 
     def save_as(self, filename: str) -> None:
-        """Save this Engine instance as a compressed file."""
-        save_data = lzma.compress(pickle.dumps(self))
-        with open(filename, "wb") as f:
-            f.write(save_data)
+        """Save this Engine instance as a compressed file.
+
+        The engine is pickled with protocol 5 so the NumPy arrays are handed
+        over as out-of-band buffers, which are streamed into the compressor
+        without being copied into the pickle.  The decompressed stream holds
+        the pickle's length and bytes, then the number of buffers followed by
+        each buffer's length and data.
+        """
+        buffers: List[pickle.PickleBuffer] = []
+        save_data = pickle.dumps(self, protocol=5, buffer_callback=buffers.append)
+
+        cctx = zstd.ZstdCompressor(level=3, threads=-1)
+        with open(filename, "wb") as f, cctx.stream_writer(f) as writer:
+            writer.write(struct.pack("<Q", len(save_data)))
+            writer.write(save_data)
+            writer.write(struct.pack("<I", len(buffers)))
+            for buffer in buffers:
+                data = buffer.raw()
+                writer.write(struct.pack("<Q", data.nbytes))
+                writer.write(data)
 
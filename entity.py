@@ -5,6 +5,7 @@ from typing import Optional, Tuple, Type, TypeVar, TYPE_CHECKING, Union
 from render_order import RenderOrder
 import math
 from components.level import Level
+from actions import BumpAction, MeleeAction, MovementAction
 
 if TYPE_CHECKING:
     from game_map import GameMap
@@ -48,7 +49,7 @@ class Entity:
         if parent:
             # If parent isn't provided now then it will be set later.
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
 
     @property
     def gamemap(self) -> GameMap:
@@ -60,22 +61,29 @@ class Entity:
         clone.x = x
         clone.y = y
         clone.parent = gamemap
-        gamemap.entities.add(clone)
+        gamemap.add_entity(clone)
         return clone
     def move(self, dx: int, dy: int) -> None:
         """Move this entity by the given amount."""
         self.x += dx
         self.y += dy
+        if self.parent is self.gamemap:
+            self.gamemap.entity_moved(self)
     def place(self, x: int, y: int, gamemap: Optional[GameMap] = None) -> None:
         """Place this entity at a new location.  Handles moving across GameMaps."""
-        self.x = x
-        self.y = y
         if gamemap:
             if hasattr(self, "parent"):  # Possibly uninitialized.
                 if self.parent is self.gamemap:
-                    self.gamemap.entities.remove(self)
+                    self.gamemap.remove_entity(self)
+            self.x = x
+            self.y = y
             self.parent = gamemap
-            gamemap.entities.add(self)
+            gamemap.add_entity(self)
+        else:
+            self.x = x
+            self.y = y
+            if self.parent is self.gamemap:
+                self.gamemap.entity_moved(self)
     def distance(self, x: int, y: int) -> float:
         """
         Return the distance between the current entity and the given (x, y) coordinate.
@@ -122,6 +130,12 @@ class Actor(Entity):
         self.level = level
         self.level.parent = self
 
+        # Reused for every move and attack of this actor instead of
+        # allocating new actions each turn.
+        self._bump = BumpAction(self, 0, 0)
+        self._melee = MeleeAction(self, 0, 0)
+        self._movement = MovementAction(self, 0, 0)
+
     @property
     def is_alive(self) -> bool:
         """Returns True as long as this actor can perform actions."""
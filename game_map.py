@@ -2,9 +2,10 @@ from __future__ import annotations
 import numpy as np  # type: ignore
 from tcod.console import Console
 
-from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
 from entity import Actor, Item
 
+from spatial_hash import SpatialHashGrid
 import tile_types
 
 if TYPE_CHECKING:
@@ -17,8 +18,21 @@ class GameMap:
     ):
         self.engine = engine
         self.width, self.height = width, height
-        self.entities = set(entities)
+        self.entities: Set[Entity] = set()
+        self.actors: List[Actor] = []  # The living actors on this map.
+        self.items: List[Item] = []  # The items lying on this map.
+        self.entity_grid = SpatialHashGrid()
+
+        # Living actor coordinates as parallel arrays, rebuilt lazily after an
+        # actor is added, removed or dies.  Movement updates them in place.
+        self._actor_positions: Optional[Tuple[List[Actor], np.ndarray, np.ndarray]] = None
+        self._actor_rows: Dict[Actor, int] = {}
+
+        for entity in entities:
+            self.add_entity(entity)
+
         self.tiles = np.full((width, height), fill_value=tile_types.wall, order="F")
+        self.refresh_tile_views()
 
         self.visible = np.full(
             (width, height), fill_value=False, order="F"
@@ -27,30 +41,105 @@ class GameMap:
             (width, height), fill_value=False, order="F"
         )  # Tiles the player has seen before
         self.downstairs_location = (0, 0)
-        self.downstairs_tiles = [(0, 0)]  # Tiles that are the downstairs
-    @property
-    def actors(self) -> Iterator[Actor]:
-        """Iterate over this maps living actors."""
-        yield from (
-            entity
-            for entity in self.entities
-            if isinstance(entity, Actor) and entity.is_alive
-        )
-    @property
-    def items(self) -> Iterator[Item]:
-        yield from (entity for entity in self.entities if isinstance(entity, Item))
+        self.downstairs_tiles: FrozenSet[Tuple[int, int]] = frozenset(
+            [(0, 0)]
+        )  # Tiles that are the downstairs
+
+    def refresh_tile_views(self) -> None:
+        """Cache views of the tile fields that are read every turn.
+
+        Must be called again if `tiles` is ever replaced by a new array.
+        """
+        self.walkable = self.tiles["walkable"]
+        self.transparent = self.tiles["transparent"]
+
+    def __getstate__(self) -> dict:
+        # The views would be pickled as independent copies of the tile data.
+        state = self.__dict__.copy()
+        del state["walkable"]
+        del state["transparent"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.refresh_tile_views()
 
     @property
     def gamemap(self) -> GameMap:
         return self
 
+    def add_entity(self, entity: Entity) -> None:
+        """Add an entity to this map and index it at its current location."""
+        if entity not in self.entities:
+            self.entities.add(entity)
+            if isinstance(entity, Actor):
+                if entity.is_alive:
+                    self.actors.append(entity)
+                self._actor_positions = None
+            elif isinstance(entity, Item):
+                self.items.append(entity)
+        self.entity_grid.insert(entity)
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from this map and from the location index."""
+        self.entities.remove(entity)
+        self.entity_grid.remove(entity)
+        if isinstance(entity, Actor):
+            if entity in self.actors:
+                self.actors.remove(entity)
+            self._actor_positions = None
+        elif isinstance(entity, Item):
+            self.items.remove(entity)
+
+    def entity_moved(self, entity: Entity) -> None:
+        """Update the location indexes after an entity on this map changed position."""
+        self.entity_grid.update(entity)
+        if self._actor_positions is not None:
+            row = self._actor_rows.get(entity)
+            if row is not None:
+                _, xs, ys = self._actor_positions
+                xs[row] = entity.x
+                ys[row] = entity.y
+
+    def actor_died(self, actor: Actor) -> None:
+        """Drop a freshly killed actor from the living actors."""
+        if actor in self.actors:
+            self.actors.remove(actor)
+        self._actor_positions = None
+
+    @property
+    def actor_positions(self) -> Tuple[List[Actor], np.ndarray, np.ndarray]:
+        """Return the living actors along with arrays of their x and y coordinates."""
+        if self._actor_positions is None:
+            actors = self.actors.copy()
+            xs = np.array([actor.x for actor in actors], dtype=np.intp)
+            ys = np.array([actor.y for actor in actors], dtype=np.intp)
+            self._actor_rows = {actor: row for row, actor in enumerate(actors)}
+            self._actor_positions = actors, xs, ys
+        return self._actor_positions
+
     def get_actor_at_location(self, x: int, y: int) -> Optional[Actor]:
-        x = int(x)
-        y = int(y)
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
+        for entity in self.entity_grid.entities_at(x, y):
+            if isinstance(entity, Actor) and entity.is_alive:
+                return entity
         return None
+
+    def get_items_at_location(self, x: int, y: int) -> Iterator[Item]:
+        """Iterate over the items lying at x, y."""
+        for entity in self.entity_grid.entities_at(x, y):
+            if isinstance(entity, Item):
+                yield entity
+
+    def get_actors_in_radius(self, x: int, y: int, radius: float) -> List[Actor]:
+        """Return the living actors within `radius` tiles of x, y."""
+        r = int(radius)
+        return [
+            entity
+            for entity in self.entity_grid.entities_in_rect(x - r, y - r, x + r, y + r)
+            if isinstance(entity, Actor)
+            and entity.is_alive
+            and entity.distance(x, y) <= radius
+        ]
     def in_bounds(self, x: int, y: int) -> bool:
         """Return True if x and y are inside of the bounds of this map."""
         return 0 <= x < self.width and 0 <= y < self.height
@@ -87,12 +176,8 @@ class GameMap:
     def get_blocking_entity_at_location(
         self, location_x: int, location_y: int,
     ) -> Optional[Entity]:
-        for entity in self.entities:
-            if (
-                entity.blocks_movement
-                and entity.x == location_x
-                and entity.y == location_y
-            ):
+        for entity in self.entity_grid.entities_at(location_x, location_y):
+            if entity.blocks_movement:
                 return entity
 
         return None
@@ -129,6 +214,7 @@ class GameWorld:
         from procgen import generate_dungeon
 
         self.current_floor += 1
+        self.engine.invalidate_fov()
 
         self.engine.game_map = generate_dungeon(
             max_rooms=self.max_rooms,
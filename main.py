@@ -6,6 +6,7 @@ import traceback
 import exceptions
 import input_handlers
 import setup_game
+import perf_kernels
 
 def save_game(handler: input_handlers.BaseEventHandler, filename: str) -> None:
     """If the current event handler has an active Engine then save it."""
@@ -21,6 +22,9 @@ def main() -> None:
         "dejavu10x10_gs_tc.png", 32, 8, tcod.tileset.CHARMAP_TCOD
     )
 
+    # Compile the scroll kernels before the game starts rather than mid-turn.
+    perf_kernels.warm_up()
+
     handler: input_handlers.BaseEventHandler = setup_game.MainMenu()
 
 
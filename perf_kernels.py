@@ -0,0 +1,78 @@
+"""Numeric kernels used by the scroll effects.
+
+When Numba is installed these are compiled with `njit`, otherwise the NumPy
+versions below are used.  Both versions take and return the same values.
+"""
+from __future__ import annotations
+
+import numpy as np  # type: ignore
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # Numba is an optional dependency.
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def nearest_visible(xs, ys, visible, cx, cy, r2):  # type: ignore
+        """Return the index of the visible point closest to cx, cy, or -1.
+
+        Only points strictly closer than the squared distance `r2` are
+        considered, and a point on cx, cy itself is skipped.
+        """
+        best = -1
+        best_d2 = r2
+        for i in range(xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            if not visible[x, y]:
+                continue
+            d2 = (x - cx) * (x - cx) + (y - cy) * (y - cy)
+            if 0 < d2 < best_d2:
+                best = i
+                best_d2 = d2
+        return best
+
+    @njit(cache=True)
+    def disk_mask(r):  # type: ignore
+        """Return a (2r+1, 2r+1) boolean mask of the tiles within `r` of its center."""
+        mask = np.zeros((2 * r + 1, 2 * r + 1), dtype=np.bool_)
+        for dx in range(-r, r + 1):
+            for dy in range(-r, r + 1):
+                mask[dx + r, dy + r] = dx * dx + dy * dy <= r * r
+        return mask
+
+else:
+
+    def nearest_visible(
+        xs: np.ndarray, ys: np.ndarray, visible: np.ndarray, cx: int, cy: int, r2: int
+    ) -> int:
+        """Return the index of the visible point closest to cx, cy, or -1.
+
+        Only points strictly closer than the squared distance `r2` are
+        considered, and a point on cx, cy itself is skipped.
+        """
+        if not len(xs):
+            return -1
+        distances = (xs - cx) ** 2 + (ys - cy) ** 2
+        distances[(distances == 0) | ~visible[xs, ys]] = np.iinfo(distances.dtype).max
+        closest = int(distances.argmin())
+        if distances[closest] < r2:
+            return closest
+        return -1
+
+    def disk_mask(r: int) -> np.ndarray:
+        """Return a (2r+1, 2r+1) boolean mask of the tiles within `r` of its center."""
+        dxs, dys = np.ogrid[-r : r + 1, -r : r + 1]
+        return dxs * dxs + dys * dys <= r * r
+
+
+def warm_up() -> None:
+    """Compile the kernels now, so the first scroll used in game doesn't stall."""
+    visible = np.ones((1, 1), dtype=bool, order="F")
+    nearest_visible(
+        np.zeros(1, dtype=np.intp), np.zeros(1, dtype=np.intp), visible, 0, 0, 1
+    )
+    disk_mask(1)
@@ -184,7 +184,7 @@ def generate_dungeon(
                 stairs_tiles.append((stair_x, stair_y))
 
     dungeon.downstairs_location = center_of_last_room
-    dungeon.downstairs_tiles = stairs_tiles  # Add this attribute to GameMap
+    dungeon.downstairs_tiles = frozenset(stairs_tiles)
 
 
     return dungeon
@@ -206,5 +206,5 @@ def place_entities(room: RectangularRoom, dungeon: GameMap, floor_number: int,)
         x = random.randint(room.x1 + 1, room.x2 - 1)
         y = random.randint(room.y1 + 1, room.y2 - 1)
         
-        if not any(entity.x == x and entity.y == y for entity in dungeon.entities):
+        if not any(dungeon.entity_grid.entities_at(x, y)):
             entity.spawn(dungeon, x, y)
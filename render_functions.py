@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import Tuple, TYPE_CHECKING
 
 import color
-import tcod
 
 if TYPE_CHECKING:
     from tcod import Console
@@ -61,8 +60,9 @@ def render_dungeon_level(
     x, y = location
 
     console.print(x=x, y=y, string=f"Dungeon level: {dungeon_level}")
-def draw_lightning(console, start, end, color_fg=(255, 255, 0), color_bg=(255, 255, 128)):
-    # Bresenham's line algorithm
-    for x, y in tcod.los.bresenham(start, end).tolist():
-        console.fg[x, y] = color_fg  # Bright yellow foreground
-        console.bg[x, y] = color_bg  # Light yellow background for extra visibility
\ No newline at end of file
+def draw_lightning(console, points, color_fg=(255, 255, 0), color_bg=(255, 255, 128)):
+    # `points` is the (N, 2) array of x, y tiles from tcod.los.bresenham.
+    xs = points[:, 0]
+    ys = points[:, 1]
+    console.fg[xs, ys] = color_fg  # Bright yellow foreground
+    console.bg[xs, ys] = color_bg  # Light yellow background for extra visibility
\ No newline at end of file
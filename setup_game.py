@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import copy
-from typing import Optional
-import lzma
+from typing import BinaryIO, Optional
 import pickle
+import struct
 import traceback
 
 import tcod
+import zstandard as zstd
 from game_map import GameWorld
 
 import color
@@ -62,10 +63,31 @@ def new_game() -> Engine:
     player.equipment.toggle_equip(leather_armor, add_message=False)
 
     return engine
+def _read_exact(reader: BinaryIO, size: int) -> bytearray:
+    """Read exactly `size` bytes from a stream into a writable buffer."""
+    data = bytearray(size)
+    view = memoryview(data)
+    position = 0
+    while position < size:
+        count = reader.readinto(view[position:])
+        if not count:
+            raise EOFError("Save file is truncated.")
+        position += count
+    return data
+
+
 def load_game(filename: str) -> Engine:
-    """Load an Engine instance from a file."""
-    with open(filename, "rb") as f:
-        engine = pickle.loads(lzma.decompress(f.read()))
+    """Load an Engine instance from a file written by `Engine.save_as`."""
+    with open(filename, "rb") as f, zstd.ZstdDecompressor().stream_reader(f) as reader:
+        (pickle_size,) = struct.unpack("<Q", _read_exact(reader, 8))
+        save_data = _read_exact(reader, pickle_size)
+        (buffer_count,) = struct.unpack("<I", _read_exact(reader, 4))
+        # Writable buffers, so the arrays rebuilt on top of them stay writable.
+        buffers = []
+        for _ in range(buffer_count):
+            (buffer_size,) = struct.unpack("<Q", _read_exact(reader, 8))
+            buffers.append(_read_exact(reader, buffer_size))
+    engine = pickle.loads(save_data, buffers=buffers)
     assert isinstance(engine, Engine)
     return engine
 
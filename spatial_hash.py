@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from entity import Entity
+
+Cell = Tuple[int, int]
+
+
+class SpatialHashGrid:
+    """
+    Buckets entities by the grid cell they stand in, so location queries only
+    look at the entities near that location instead of every entity on the map.
+
+    With a cell size of 1 every tile is its own bucket and point lookups are a
+    single dict access.
+    """
+
+    def __init__(self, cell_size: int = 1):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List[Entity]] = {}
+        self._entity_cells: Dict[Entity, Cell] = {}
+
+    def cell_at(self, x: int, y: int) -> Cell:
+        """Return the cell that contains the tile at x, y."""
+        return int(x) // self.cell_size, int(y) // self.cell_size
+
+    def insert(self, entity: Entity) -> None:
+        """Add an entity to the cell at its current position."""
+        if entity in self._entity_cells:
+            self.update(entity)
+            return
+        cell = self.cell_at(entity.x, entity.y)
+        self._cells.setdefault(cell, []).append(entity)
+        self._entity_cells[entity] = cell
+
+    def remove(self, entity: Entity) -> None:
+        """Remove an entity from the cell it was last recorded in."""
+        cell = self._entity_cells.pop(entity, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        bucket.remove(entity)
+        if not bucket:
+            del self._cells[cell]
+
+    def update(self, entity: Entity) -> None:
+        """Move an entity into the cell matching its current position."""
+        old_cell = self._entity_cells.get(entity)
+        if old_cell is None:
+            return
+        new_cell = self.cell_at(entity.x, entity.y)
+        if new_cell == old_cell:
+            return
+        bucket = self._cells[old_cell]
+        bucket.remove(entity)
+        if not bucket:
+            del self._cells[old_cell]
+        self._cells.setdefault(new_cell, []).append(entity)
+        self._entity_cells[entity] = new_cell
+
+    def entities_at(self, x: int, y: int) -> Iterator[Entity]:
+        """Iterate over the entities standing exactly on x, y."""
+        x = int(x)
+        y = int(y)
+        for entity in self._cells.get(self.cell_at(x, y), ()):
+            if entity.x == x and entity.y == y:
+                yield entity
+
+    def entities_in_rect(self, x1: int, y1: int, x2: int, y2: int) -> List[Entity]:
+        """Return the entities inside the inclusive rectangle x1, y1 to x2, y2."""
+        cx1, cy1 = self.cell_at(x1, y1)
+        cx2, cy2 = self.cell_at(x2, y2)
+        cells = self._cells
+        found = []
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                for entity in cells.get((cx, cy), ()):
+                    if x1 <= entity.x <= x2 and y1 <= entity.y <= y2:
+                        found.append(entity)
+        return found